@@ -0,0 +1,158 @@
+"""
+AIFE - Advanced Interactive File Explorer
+Chatbot Core Module
+
+Rule-based response engine and settings storage for the assistant.
+Pure Python (no Qt) so it can be imported without loading PyQt5.
+"""
+
+import random
+import json
+import os
+from typing import Dict, Tuple
+
+# Optional faster JSON codec; falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode to indented JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+class ChatbotSettings:
+    """Manage chatbot settings"""
+    
+    CONFIG_FILE = os.path.expanduser("~/.aife_chatbot_config.json")
+    
+    DEFAULT_SETTINGS = {
+        "api_key": "",
+        "model": "gpt-3.5-turbo",
+        "temperature": 0.7,
+        "enable_ai": False,
+        "max_history": 20
+    }
+    
+    # Parsed config shared by all instances: path -> (st_mtime_ns, settings)
+    _CACHE: Dict[str, Tuple[int, dict]] = {}
+    
+    def __init__(self):
+        self.settings = self.load_settings()
+    
+    def load_settings(self) -> dict:
+        """Load settings from file (re-parsed only when its mtime changes)"""
+        try:
+            mtime_ns = os.stat(self.CONFIG_FILE).st_mtime_ns
+        except OSError:
+            return self.DEFAULT_SETTINGS.copy()
+        
+        cached = self._CACHE.get(self.CONFIG_FILE)
+        if cached is None or cached[0] != mtime_ns:
+            try:
+                with open(self.CONFIG_FILE, 'rb') as f:
+                    cached = (mtime_ns, _json_loads(f.read()))
+            except Exception:
+                return self.DEFAULT_SETTINGS.copy()
+            self._CACHE[self.CONFIG_FILE] = cached
+        
+        # Copy so callers can't mutate the shared cached dict
+        return cached[1].copy()
+    
+    def save_settings(self, settings: dict) -> bool:
+        """Save settings to file"""
+        try:
+            with open(self.CONFIG_FILE, 'wb') as f:
+                f.write(_json_dumps(settings))
+            self._CACHE[self.CONFIG_FILE] = (
+                os.stat(self.CONFIG_FILE).st_mtime_ns, settings.copy()
+            )
+            self.settings = settings
+            return True
+        except Exception:
+            return False
+    
+    def get(self, key: str, default=None):
+        """Get a setting value"""
+        return self.settings.get(key, default)
+    
+    def set(self, key: str, value):
+        """Set a setting value"""
+        self.settings[key] = value
+
+
+# Canned responses keyed by trigger keyword, in match priority order
+_RESPONSES: Dict[str, Tuple[str, ...]] = {
+    "hello": (
+        "Hello! I'm AIFE's assistant. How can I help you explore your files?",
+        "Hi there! Need help navigating your file system?",
+        "Greetings! What would you like to do with your files?"
+    ),
+    "help": (
+        "I can help you with:\n• File navigation tips\n• Explaining file properties\n• Suggesting file operations\n• Understanding permissions",
+        "What do you need help with? I can assist with file operations, navigation, or explain file system concepts.",
+    ),
+    "permissions": (
+        "File permissions use three digits:\n• First digit: Owner permissions\n• Second digit: Group permissions\n• Third digit: Other permissions\n\nEach can be 0-7 (sum of r=4, w=2, x=1)",
+        "Permissions control who can read (r), write (w), or execute (x) a file. They're shown in octal (0-7) or as rwx notation.",
+    ),
+    "symlink": (
+        "A symbolic link (shortcut) points to another file or directory without copying its contents.",
+        "Symlinks are references to other files. They're shown with 🔗 in the file list.",
+    ),
+    "inode": (
+        "An inode is a unique identifier for a file on the filesystem. Each file has exactly one inode number.",
+        "Inodes store file metadata like size, permissions, and ownership. Hard links share the same inode.",
+    ),
+    "how do i": (
+        "I can help! Be more specific about what you'd like to do with your files.",
+        "Try right-clicking files for options, or use the toolbar buttons for navigation.",
+    ),
+    "default": (
+        "That's interesting! I'm here to help with file operations and system concepts. What would you like to know?",
+        "I can help with file management and filesystem concepts. What's your question?",
+        "Feel free to ask about files, permissions, links, or how to navigate your system!",
+    )
+}
+
+
+class Chatbot:
+    """Simple rule-based chatbot for AIFE assistance"""
+    
+    # Keyword table built once: (keyword, responses) pairs in priority
+    # order, so get_response does not rebuild it on every message. A plain
+    # substring scan over six short keywords beats a compiled regex
+    # alternation, which rescans the input once per keyword anyway
+    _KEYWORD_TABLE = tuple(
+        (keyword, responses)
+        for keyword, responses in _RESPONSES.items()
+        if keyword != "default"
+    )
+    
+    def __init__(self):
+        # Shared, immutable response table (kept as an attribute for callers)
+        self.responses = _RESPONSES
+    
+    def get_response(self, user_input: str) -> str:
+        """Generate a response based on user input"""
+        # Keywords have no surrounding whitespace, so lowering is enough
+        user_input = user_input.lower()
+        
+        # Check for keyword matches
+        for keyword, responses in self._KEYWORD_TABLE:
+            if keyword in user_input:
+                return random.choice(responses)
+        
+        # Default response
+        return random.choice(_RESPONSES["default"])
@@ -0,0 +1,232 @@
+"""
+AIFE - Advanced Interactive File Explorer
+Chatbot UI Module
+
+PyQt5 widgets for the assistant panel and its settings dialog.
+"""
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QLineEdit, 
+    QPushButton, QLabel, QScrollArea, QDialog, QFormLayout,
+    QSpinBox, QCheckBox, QMessageBox
+)
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QFont, QColor, QTextCursor, QTextCharFormat
+
+from chatbot_core import Chatbot, ChatbotSettings
+
+
+class ChatbotSignals(QObject):
+    """Signals for chatbot"""
+    response_generated = pyqtSignal(str)
+
+
+class ChatbotResponseTask(QRunnable):
+    """Generates a chatbot reply on a worker thread"""
+    
+    def __init__(self, chatbot: Chatbot, user_message: str, signals: ChatbotSignals):
+        super().__init__()
+        self.chatbot = chatbot
+        self.user_message = user_message
+        self.signals = signals
+    
+    def run(self):
+        """Compute the reply and hand it back to the GUI thread"""
+        response = self.chatbot.get_response(self.user_message)
+        self.signals.response_generated.emit(response)
+
+
+class ChatbotSettingsDialog(QDialog):
+    """Settings dialog for chatbot configuration"""
+    
+    def __init__(self, settings: ChatbotSettings, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Chatbot Settings")
+        self.setGeometry(200, 200, 400, 300)
+        self.settings = settings
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Setup settings dialog UI"""
+        layout = QFormLayout(self)
+        
+        # API Key
+        self.api_key_input = QLineEdit()
+        self.api_key_input.setPlaceholderText("Enter your API key...")
+        self.api_key_input.setEchoMode(QLineEdit.Password)
+        self.api_key_input.setText(self.settings.get("api_key", ""))
+        layout.addRow("OpenAI API Key:", self.api_key_input)
+        
+        # Model selection
+        self.model_input = QLineEdit()
+        self.model_input.setText(self.settings.get("model", "gpt-3.5-turbo"))
+        layout.addRow("Model:", self.model_input)
+        
+        # Temperature
+        self.temperature_input = QSpinBox()
+        self.temperature_input.setMinimum(0)
+        self.temperature_input.setMaximum(100)
+        self.temperature_input.setValue(int(self.settings.get("temperature", 0.7) * 100))
+        self.temperature_input.setSuffix("%")
+        layout.addRow("Temperature (Creativity):", self.temperature_input)
+        
+        # Enable AI
+        self.enable_ai_checkbox = QCheckBox("Enable AI responses")
+        self.enable_ai_checkbox.setChecked(self.settings.get("enable_ai", False))
+        layout.addRow(self.enable_ai_checkbox)
+        
+        # Max history
+        self.max_history_input = QSpinBox()
+        self.max_history_input.setMinimum(5)
+        self.max_history_input.setMaximum(100)
+        self.max_history_input.setValue(self.settings.get("max_history", 20))
+        layout.addRow("Max Chat History:", self.max_history_input)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self.save_settings)
+        button_layout.addWidget(save_button)
+        
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        
+        layout.addRow(button_layout)
+    
+    def save_settings(self):
+        """Save settings and close dialog"""
+        settings_dict = {
+            "api_key": self.api_key_input.text(),
+            "model": self.model_input.text(),
+            "temperature": self.temperature_input.value() / 100,
+            "enable_ai": self.enable_ai_checkbox.isChecked(),
+            "max_history": self.max_history_input.value()
+        }
+        
+        if self.settings.save_settings(settings_dict):
+            QMessageBox.information(self, "Success", "Settings saved successfully!")
+            self.accept()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to save settings.")
+
+
+class ChatbotWidget(QWidget):
+    """ChatBot UI Widget"""
+    
+    def __init__(self):
+        super().__init__()
+        self.chatbot = Chatbot()
+        self.settings = ChatbotSettings()
+        self.signals = ChatbotSignals()
+        self.setup_ui()
+        
+        # Replies arrive from worker threads; the bound slot on this
+        # widget makes Qt queue them back onto the GUI thread
+        self.signals.response_generated.connect(self.on_response_generated)
+    
+    def setup_ui(self):
+        """Setup chatbot UI"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(5)
+        
+        # Title with settings button
+        title_layout = QHBoxLayout()
+        title = QLabel("💬 Assistant")
+        title_font = QFont()
+        title_font.setBold(True)
+        title_font.setPointSize(10)
+        title.setFont(title_font)
+        title_layout.addWidget(title)
+        
+        # Settings button
+        settings_button = QPushButton("⚙️")
+        settings_button.setMaximumWidth(35)
+        settings_button.setToolTip("Chatbot Settings")
+        settings_button.clicked.connect(self.show_settings)
+        title_layout.addWidget(settings_button)
+        title_layout.addStretch()
+        
+        layout.addLayout(title_layout)
+        
+        # Chat display
+        self.chat_display = QTextEdit()
+        self.chat_display.setReadOnly(True)
+        self.chat_display.setFont(QFont("Courier", 8))
+        self.chat_display.setMaximumHeight(500)
+        self._apply_history_limit()
+        
+        # Character formats built once and reused for every message
+        self._user_format = QTextCharFormat()
+        self._user_format.setForeground(QColor(0, 100, 200))
+        self._assistant_format = QTextCharFormat()
+        self._assistant_format.setForeground(QColor(50, 150, 50))
+        
+        # Initial greeting
+        self._append_message("Assistant", "Hello! I'm AIFE's assistant. How can I help?")
+        
+        layout.addWidget(self.chat_display)
+        
+        # Input area
+        input_layout = QHBoxLayout()
+        self.input_field = QLineEdit()
+        self.input_field.setPlaceholderText("Ask me anything about files...")
+        self.input_field.returnPressed.connect(self.on_send_message)
+        input_layout.addWidget(self.input_field)
+        
+        send_button = QPushButton("Send")
+        send_button.setMaximumWidth(60)
+        send_button.clicked.connect(self.on_send_message)
+        input_layout.addWidget(send_button)
+        
+        layout.addLayout(input_layout)
+        layout.addStretch()
+    
+    def on_send_message(self):
+        """Handle message send"""
+        user_message = self.input_field.text().strip()
+        if not user_message:
+            return
+        
+        # Display user message
+        self._append_message("You", user_message)
+        
+        # Generate bot response off the GUI thread
+        task = ChatbotResponseTask(self.chatbot, user_message, self.signals)
+        QThreadPool.globalInstance().start(task)
+        
+        # Clear input
+        self.input_field.clear()
+        self.input_field.setFocus()
+    
+    def on_response_generated(self, response: str):
+        """Display a bot response delivered by ChatbotResponseTask"""
+        self._append_message("Assistant", response)
+    
+    def _append_message(self, sender: str, message: str):
+        """Append message to chat display (one insert, no per-message recolouring)"""
+        fmt = self._user_format if sender == "You" else self._assistant_format
+        
+        cursor = self.chat_display.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not self.chat_display.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(f"{sender}: {message}", fmt)
+        
+        # Blank separator line, then scroll to the end
+        cursor.insertBlock()
+        self.chat_display.setTextCursor(cursor)
+    
+    def _apply_history_limit(self):
+        """Cap the chat log so old blocks are dropped instead of re-laid out"""
+        # Roughly 4 blocks per message (text lines plus separator)
+        max_history = self.settings.get("max_history", 20)
+        self.chat_display.document().setMaximumBlockCount(max_history * 4)
+    
+    def show_settings(self):
+        """Show settings dialog"""
+        dialog = ChatbotSettingsDialog(self.settings, self)
+        if dialog.exec_():
+            self._apply_history_limit()
@@ -13,30 +13,36 @@ OS Concepts:
 """
 
 import os
-import subprocess
-from typing import Optional, List, Callable
-from enum import Enum
+import re
+import stat
+from collections import deque
+from typing import Any, Optional, List, Callable, Deque, Iterator
+from enum import IntEnum
 from dataclasses import dataclass
 
 from filesystem import FileSystemAbstraction, FileNode
 
 
-class FileOperationType(Enum):
-    """Types of file operations"""
-    LIST = "list_directory"
-    DELETE = "delete"
-    RENAME = "rename"
-    OPEN = "open"
-    GET_INFO = "get_info"
+# Characters not allowed in a single filename: NUL and path separators
+_BAD_NAME_CHARS = re.compile(r'[\x00/\\]').search
 
 
-@dataclass
+class FileOperationType(IntEnum):
+    """Types of file operations (int-valued so comparisons are plain int ==)"""
+    LIST = 1
+    DELETE = 2
+    RENAME = 3
+    OPEN = 4
+    GET_INFO = 5
+
+
+@dataclass(slots=True, frozen=True)
 class OperationResult:
-    """Result of a file operation"""
+    """Result of a file operation (immutable once created)"""
     success: bool
     operation: FileOperationType
     message: str
-    data: any = None
+    data: Any = None
     error_type: str = None
 
 
@@ -48,6 +54,55 @@ class PermissionError_Custom(Exception):
         super().__init__(message)
 
 
+# Error dispatch table: operation → {exception type: (message, error_type)}
+# Messages may use {path} and {strerror}. Lookup walks the exception's MRO,
+# so the most specific mapped class wins and OSError is the catch-all.
+_ERROR_MAP = {
+    FileOperationType.LIST: {
+        NotADirectoryError: ("Not a directory: {path}", "NotADirectory"),
+        PermissionError: ("Permission denied. You don't have read access to this folder.",
+                          "PermissionDenied"),
+        FileNotFoundError: ("Directory not found: {path}", "NotFound"),
+        OSError: ("Error reading directory: {strerror}", "OSError"),
+    },
+    FileOperationType.GET_INFO: {
+        FileNotFoundError: ("File not found: {path}", "NotFound"),
+        PermissionError: ("Permission denied: {path}", "PermissionDenied"),
+        OSError: ("Error getting file info: {strerror}", "OSError"),
+    },
+    FileOperationType.DELETE: {
+        PermissionError: ("Permission denied: You don't have permission to delete this file. "
+                          "Check write permission on the folder containing this file.",
+                          "PermissionDenied"),
+        FileNotFoundError: ("File not found: {path}", "NotFound"),
+        IsADirectoryError: ("Cannot delete non-empty directory: {path}", "DirectoryNotEmpty"),
+        OSError: ("Error deleting file: {strerror}", "OSError"),
+    },
+    FileOperationType.RENAME: {
+        PermissionError: ("Permission denied: You don't have permission to rename this file.",
+                          "PermissionDenied"),
+        FileNotFoundError: ("File not found: {path}", "NotFound"),
+        FileExistsError: ("A file with that name already exists.", "FileExists"),
+        OSError: ("Error renaming file: {strerror}", "OSError"),
+    },
+}
+
+# Failures whose message has no per-call fields are identical every time.
+# OperationResult is frozen, so one prebuilt instance per
+# (operation, exception type) is shared instead of allocating a new one.
+_STATIC_ERROR_RESULTS = {
+    (operation, error_class): OperationResult(
+        success=False,
+        operation=operation,
+        message=template,
+        error_type=error_type
+    )
+    for operation, error_map in _ERROR_MAP.items()
+    for error_class, (template, error_type) in error_map.items()
+    if "{" not in template
+}
+
+
 class FileManager:
     """
     File Manager - coordinates file system operations
@@ -57,15 +112,17 @@ class FileManager:
     - Validate permissions before operations
     - Handle errors and provide user-friendly messages
     - Map OS errors to application errors
-    - Maintain operation history
+    - Maintain operation history (bounded to the most recent HISTORY_LIMIT)
     """
     
+    HISTORY_LIMIT = 1000  # Max operation results kept in history
+    
     def __init__(self, home_dir: str = None):
         """Initialize file manager with file system abstraction"""
         self.fs = FileSystemAbstraction(home_dir)
         self.current_directory = self.fs.home_dir
         self.operation_callbacks: List[Callable] = []
-        self.operation_history: List[OperationResult] = []
+        self.operation_history: Deque[OperationResult] = deque(maxlen=self.HISTORY_LIMIT)
     
     def register_operation_callback(self, callback: Callable) -> None:
         """Register callback for operation completion"""
@@ -74,12 +131,37 @@ class FileManager:
     def _notify_operation(self, result: OperationResult) -> None:
         """Notify all registered callbacks of operation result"""
         self.operation_history.append(result)
-        for callback in self.operation_callbacks:
+        
+        callbacks = self.operation_callbacks
+        if not callbacks:
+            return
+        
+        for callback in callbacks:
             try:
                 callback(result)
             except Exception as e:
                 print(f"Error in operation callback: {e}")
     
+    def _error_result(self, operation: FileOperationType, error: OSError,
+                      path: str) -> OperationResult:
+        """Map an OS error to a failed OperationResult via _ERROR_MAP"""
+        error_map = _ERROR_MAP[operation]
+        for error_class in type(error).__mro__:
+            if error_class in error_map:
+                break
+        
+        static_result = _STATIC_ERROR_RESULTS.get((operation, error_class))
+        if static_result is not None:
+            return static_result
+        
+        template, error_type = error_map[error_class]
+        return OperationResult(
+            success=False,
+            operation=operation,
+            message=template.format(path=path, strerror=error.strerror),
+            error_type=error_type
+        )
+    
     def browse_directory(self, path: str) -> OperationResult:
         """
         Browse a directory and get its contents
@@ -90,10 +172,10 @@ class FileManager:
         - NotADirectoryError: Path is not a directory
         - OSError: Other OS errors
         """
+        # Validate and normalize path
+        path = self.fs.normalize_path(path)
+        
         try:
-            # Validate and normalize path
-            path = self.fs.normalize_path(path)
-            
             # List directory contents
             files = self.fs.list_directory(path)
             
@@ -106,42 +188,23 @@ class FileManager:
                 message=f"Listed {len(files)} items in {path}",
                 data=files
             )
-            
-        except NotADirectoryError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.LIST,
-                message=f"Not a directory: {path}",
-                error_type="NotADirectory"
-            )
-        
-        except PermissionError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.LIST,
-                message=f"Permission denied. You don't have read access to this folder.",
-                error_type="PermissionDenied"
-            )
-        
-        except FileNotFoundError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.LIST,
-                message=f"Directory not found: {path}",
-                error_type="NotFound"
-            )
         
         except OSError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.LIST,
-                message=f"Error reading directory: {e.strerror}",
-                error_type="OSError"
-            )
+            result = self._error_result(FileOperationType.LIST, e, path)
         
         self._notify_operation(result)
         return result
     
+    def iter_directory(self, path: str) -> Iterator[FileNode]:
+        """
+        Stream a directory's entries, unsorted, as they are read
+        
+        For early display only: errors propagate as OSError and nothing is
+        recorded. Follow with browse_directory() for the sorted listing
+        and the OperationResult (a fully consumed stream leaves it cached).
+        """
+        return self.fs.iter_directory(self.fs.normalize_path(path))
+    
     def get_file_info(self, path: str) -> OperationResult:
         """
         Get metadata for a file
@@ -158,29 +221,8 @@ class FileManager:
                 data=file_info
             )
         
-        except FileNotFoundError:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.GET_INFO,
-                message=f"File not found: {path}",
-                error_type="NotFound"
-            )
-        
-        except PermissionError:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.GET_INFO,
-                message=f"Permission denied: {path}",
-                error_type="PermissionDenied"
-            )
-        
         except OSError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.GET_INFO,
-                message=f"Error getting file info: {e.strerror}",
-                error_type="OSError"
-            )
+            result = self._error_result(FileOperationType.GET_INFO, e, path)
         
         self._notify_operation(result)
         return result
@@ -204,38 +246,8 @@ class FileManager:
                 message=f"Successfully deleted {os.path.basename(path)}"
             )
         
-        except PermissionError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.DELETE,
-                message=f"Permission denied: You don't have permission to delete this file. "
-                        f"Check write permission on the folder containing this file.",
-                error_type="PermissionDenied"
-            )
-        
-        except FileNotFoundError:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.DELETE,
-                message=f"File not found: {path}",
-                error_type="NotFound"
-            )
-        
-        except IsADirectoryError:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.DELETE,
-                message=f"Cannot delete non-empty directory: {path}",
-                error_type="DirectoryNotEmpty"
-            )
-        
         except OSError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.DELETE,
-                message=f"Error deleting file: {e.strerror}",
-                error_type="OSError"
-            )
+            result = self._error_result(FileOperationType.DELETE, e, path)
         
         self._notify_operation(result)
         return result
@@ -249,22 +261,22 @@ class FileManager:
         - FileNotFoundError: Source file doesn't exist
         - FileExistsError: Destination already exists
         """
+        # Check if new name is valid (not empty, no NUL or path separators)
+        if not new_name or _BAD_NAME_CHARS(new_name):
+            result = OperationResult(
+                success=False,
+                operation=FileOperationType.RENAME,
+                message=f"Invalid filename: {new_name}",
+                error_type="InvalidFilename"
+            )
+            self._notify_operation(result)
+            return result
+        
         try:
             # Construct new path (same directory, new name)
-            parent = os.path.dirname(old_path)
+            parent, _ = os.path.split(old_path)
             new_path = os.path.join(parent, new_name)
             
-            # Check if new name is valid (not empty, no path separators)
-            if not new_name or '/' in new_name or '\\' in new_name:
-                result = OperationResult(
-                    success=False,
-                    operation=FileOperationType.RENAME,
-                    message=f"Invalid filename: {new_name}",
-                    error_type="InvalidFilename"
-                )
-                self._notify_operation(result)
-                return result
-            
             # Perform rename
             self.fs.rename_file(old_path, new_path)
             
@@ -274,37 +286,8 @@ class FileManager:
                 message=f"Successfully renamed to {new_name}"
             )
         
-        except PermissionError:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.RENAME,
-                message=f"Permission denied: You don't have permission to rename this file.",
-                error_type="PermissionDenied"
-            )
-        
-        except FileNotFoundError:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.RENAME,
-                message=f"File not found: {old_path}",
-                error_type="NotFound"
-            )
-        
-        except FileExistsError:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.RENAME,
-                message=f"A file with that name already exists.",
-                error_type="FileExists"
-            )
-        
         except OSError as e:
-            result = OperationResult(
-                success=False,
-                operation=FileOperationType.RENAME,
-                message=f"Error renaming file: {e.strerror}",
-                error_type="OSError"
-            )
+            result = self._error_result(FileOperationType.RENAME, e, old_path)
         
         self._notify_operation(result)
         return result
@@ -314,16 +297,24 @@ class FileManager:
         Open a file with default application
         
         Uses xdg-open on Linux (respects desktop environment defaults)
+        
+        System call: a single os.stat() → stat() both checks existence and
+        file type (S_ISREG) instead of separate exists()/isfile() calls
         """
         try:
-            if not os.path.exists(path):
+            file_stat = os.stat(path)
+        except OSError:
+            file_stat = None
+        
+        try:
+            if file_stat is None:
                 result = OperationResult(
                     success=False,
                     operation=FileOperationType.OPEN,
                     message=f"File not found: {path}",
                     error_type="NotFound"
                 )
-            elif not os.path.isfile(path):
+            elif not stat.S_ISREG(file_stat.st_mode):
                 result = OperationResult(
                     success=False,
                     operation=FileOperationType.OPEN,
@@ -331,6 +322,9 @@ class FileManager:
                     error_type="IsDirectory"
                 )
             else:
+                # Deferred import: only needed when a file is actually opened
+                import subprocess
+                
                 # Use xdg-open on Linux (desktop environment agnostic)
                 subprocess.Popen(['xdg-open', path])
                 result = OperationResult(
@@ -372,14 +366,23 @@ class FileManager:
         
         return self.browse_directory(parent)
     
+    def clear_caches(self) -> None:
+        """Discard cached file system lookups (used by explicit refresh)"""
+        self.fs.clear_path_cache()
+        self.fs.clear_directory_cache()
+    
     def get_current_directory(self) -> str:
         """Get current working directory"""
         return self.current_directory
     
+    def get_parent_directory(self, path: str) -> Optional[str]:
+        """Get parent directory of path, or None at the root"""
+        return self.fs.get_parent_directory(path)
+    
     def get_home_directory(self) -> str:
         """Get home directory"""
         return self.fs.home_dir
     
     def get_operation_history(self) -> List[OperationResult]:
         """Get history of operations"""
-        return self.operation_history.copy()
+        return list(self.operation_history)
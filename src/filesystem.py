@@ -13,14 +13,36 @@ OS Concepts:
 """
 
 import os
+import math
 import stat
+import time
+import pwd
+import grp
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from stat import S_IMODE, S_ISDIR, S_ISLNK
+from typing import List, Optional, Dict, Tuple, Iterator
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 
 
-@dataclass
+# Size units for FileNode.get_human_size, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Precomputed rwx strings and octal text for every plain permission value
+# (0o000-0o777), one table per file type. setuid/setgid/sticky bits are
+# rare and fall back to stat.filemode() / oct()
+_PERM_STRINGS_FILE = tuple(stat.filemode(bits | stat.S_IFREG) for bits in range(0o1000))
+_PERM_STRINGS_DIR = tuple(stat.filemode(bits | stat.S_IFDIR) for bits in range(0o1000))
+_PERM_STRINGS_LNK = tuple(stat.filemode(bits | stat.S_IFLNK) for bits in range(0o1000))
+_PERM_OCTAL = tuple(oct(bits)[2:] for bits in range(0o1000))
+
+
+@dataclass(slots=True, frozen=True)
 class FileNode:
     """
     Represents a file in the file system (analogous to inode with metadata)
@@ -37,6 +59,15 @@ class FileNode:
     - accessed_time: st_atime - access time from inode
     - is_symlink: S_ISLNK(mode) - symlink type from inode
     - inode_number: st_ino - actual inode number from OS
+    
+    Instances are immutable and slotted (no per-instance __dict__), so
+    cached directory listings can be shared safely.
+    
+    The get_*/name helpers only read the stored fields (never re-stat) and
+    are already memoized at module level: permission strings come from
+    precomputed tables, times and owner/group names from LRU caches. That
+    is why there are no per-instance cached properties, which would also
+    need the __dict__ that slots remove.
     """
     name: str                 # Filename
     path: str                 # Absolute path
@@ -52,24 +83,117 @@ class FileNode:
     hard_links: int          # Hard link count (st_nlink)
     
     def get_human_size(self) -> str:
-        """Convert byte size to human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if self.size < 1024:
-                return f"{self.size:.1f} {unit}"
-            self.size /= 1024
-        return f"{self.size:.1f} PB"
+        """Convert byte size to human-readable format (does not modify size)"""
+        if self.size < 1024:
+            return f"{self.size} B"
+        
+        # Each unit is 2**10 bytes larger, so the bit length picks it directly
+        index = min((self.size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{self.size / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
     
     def get_permissions_string(self) -> str:
-        """Return permission string like 'rwxr-xr-x'"""
-        return stat.filemode(self.permissions | stat.S_IFREG)
+        """Return permission string like '-rwxr-xr-x' (type char: -, d or l)"""
+        if self.is_symlink:
+            table, file_type = _PERM_STRINGS_LNK, stat.S_IFLNK
+        elif self.is_dir:
+            table, file_type = _PERM_STRINGS_DIR, stat.S_IFDIR
+        else:
+            table, file_type = _PERM_STRINGS_FILE, stat.S_IFREG
+        
+        if self.permissions < 0o1000:
+            return table[self.permissions]
+        return stat.filemode(self.permissions | file_type)
     
     def get_permission_octal(self) -> str:
         """Return permission in octal format like '755'"""
+        if self.permissions < 0o1000:
+            return _PERM_OCTAL[self.permissions]
         return oct(self.permissions)[2:]
     
+    @property
+    def owner_name(self) -> str:
+        """Owner user name for owner_uid (cached NSS lookup)"""
+        return _uid_to_name(self.owner_uid)
+    
+    @property
+    def group_name(self) -> str:
+        """Group name for owner_gid (cached NSS lookup)"""
+        return _gid_to_name(self.owner_gid)
+    
     def get_modified_time_str(self) -> str:
         """Return formatted modification time"""
-        return datetime.fromtimestamp(self.modified_time).strftime('%Y-%m-%d %H:%M:%S')
+        return _format_timestamp(math.floor(self.modified_time))
+
+
+# fd-relative directory scanning (fdopendir + fstatat) is available on
+# Linux and macOS; elsewhere list_directory scans by path instead
+_SCANDIR_DIR_FD = os.scandir in os.supports_fd and hasattr(os, "O_DIRECTORY")
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(seconds: int) -> str:
+    """
+    Format a whole-second timestamp as local 'YYYY-MM-DD HH:MM:SS'
+    
+    Cached per second: files extracted or copied together share mtimes,
+    so neighbouring rows reuse one string instead of re-formatting.
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
+
+def _stat_entry(entry: os.DirEntry) -> Optional[Tuple[bool, os.stat_result]]:
+    """
+    Return (is_symlink, stat_result) for a directory entry, or None if it
+    cannot be stat'ed (broken symlink, permission denied)
+    
+    is_symlink comes from the getdents64 d_type (no extra syscall);
+    entry.stat() is fstatat(dir_fd, name) and follows symlinks.
+    """
+    try:
+        return entry.is_symlink(), entry.stat()
+    except OSError:
+        return None
+
+
+def _stat_entries(entries: List[os.DirEntry]) -> List[Optional[Tuple[bool, os.stat_result]]]:
+    """Run _stat_entry over a chunk of entries (one thread pool task)"""
+    return [_stat_entry(entry) for entry in entries]
+
+
+@lru_cache(maxsize=1024)
+def _uid_to_name(uid: int) -> str:
+    """
+    Resolve a UID to a user name: getpwuid() → NSS (/etc/passwd, LDAP, ...)
+    
+    Cached because a directory usually has only a few distinct owners,
+    while each uncached lookup may go through nscd or a network service.
+    Unknown UIDs fall back to the number itself.
+    """
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=1024)
+def _gid_to_name(gid: int) -> str:
+    """Resolve a GID to a group name via getgrgid() (cached, see _uid_to_name)"""
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+@lru_cache(maxsize=256)
+def _resolve_path(path: str) -> str:
+    """
+    Memoized realpath(expanduser(path))
+    
+    Navigation revisits the same directories, so the readlink() walk
+    done by realpath is cached per path string. Cleared on refresh via
+    FileSystemAbstraction.clear_path_cache().
+    """
+    return os.path.realpath(os.path.expanduser(path))
 
 
 class FileSystemAbstraction:
@@ -78,18 +202,22 @@ class FileSystemAbstraction:
     
     Demonstrates key OS concepts:
     1. VFS Abstraction: Hides underlying file system implementation
-    2. System Calls: Uses os.stat(), os.listdir(), os.access()
+    2. System Calls: Uses os.stat(), os.scandir(), os.access()
     3. Path Resolution: Normalizes paths through the VFS
     4. Permission Checks: Respects Linux permission model
     5. File Type Detection: Differentiates file types via inode mode bits
     
     System calls made (mapping to Linux):
     - os.stat(path)       → stat() syscall
-    - os.listdir(path)    → getdents()/getdents64() syscall
+    - os.scandir(path)    → getdents()/getdents64() syscall
     - os.access(path, m)  → access() syscall
     - os.path.realpath()  → readlink() for symlinks
     """
     
+    DIR_CACHE_SIZE = 64  # Max directory listings kept in the LRU cache
+    DIR_CACHE_TTL = 2.0  # Seconds a cached listing's per-file metadata is trusted
+    PARALLEL_STAT_THRESHOLD = 200  # Entries above which stats run on a thread pool
+    
     def __init__(self, home_dir: str = None):
         """
         Initialize file system abstraction layer
@@ -100,96 +228,241 @@ class FileSystemAbstraction:
         self.home_dir = home_dir or os.path.expanduser("~")
         self.current_path = self.home_dir
         self._validate_path(self.home_dir)
+        
+        # LRU cache of listings:
+        # path -> (directory st_mtime_ns, time.monotonic() of scan, sorted nodes)
+        self._dir_cache: OrderedDict[str, Tuple[int, float, List[FileNode]]] = OrderedDict()
+        self._dir_cache_lock = threading.Lock()  # GUI loads listings off-thread
+        
+        # Created on first large listing and reused afterwards
+        self._stat_workers = (os.cpu_count() or 1) * 2
+        self._stat_executor: Optional[ThreadPoolExecutor] = None
+    
+    def _get_stat_executor(self) -> ThreadPoolExecutor:
+        """Return the shared thread pool used for parallel stat() calls"""
+        if self._stat_executor is None:
+            self._stat_executor = ThreadPoolExecutor(
+                max_workers=self._stat_workers,
+                thread_name_prefix="aife-stat"
+            )
+        return self._stat_executor
+    
+    def _get_cached_listing(self, path: str, mtime_ns: int) -> Optional[List[FileNode]]:
+        """
+        Return the cached sorted listing if the directory is unchanged and
+        was scanned less than DIR_CACHE_TTL seconds ago
+        
+        The directory's mtime only covers its entries (add/remove/rename);
+        rewriting a file inside it changes that file's size and mtime but
+        not the directory's, so per-file metadata is re-stat'ed once the
+        listing is older than the TTL (e.g. on Back/Forward).
+        """
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(path)
+            if (cached is not None and cached[0] == mtime_ns
+                    and time.monotonic() - cached[1] < self.DIR_CACHE_TTL):
+                self._dir_cache.move_to_end(path)
+                return cached[2]
+        return None
+    
+    def _store_listing(self, path: str, mtime_ns: int, keyed_files: list) -> List[FileNode]:
+        """Sort ((folder-last flag, casefolded name), node) pairs and cache the nodes"""
+        keyed_files.sort(key=itemgetter(0))
+        files = [node for _, node in keyed_files]
+        
+        with self._dir_cache_lock:
+            self._dir_cache[path] = (mtime_ns, time.monotonic(), files)
+            self._dir_cache.move_to_end(path)
+            if len(self._dir_cache) > self.DIR_CACHE_SIZE:
+                self._dir_cache.popitem(last=False)
+        
+        return files
+    
+    def _stat_results(self, entries: List[os.DirEntry]) -> Iterator[Optional[Tuple[bool, os.stat_result]]]:
+        """
+        Yield _stat_entry() results for entries, in entry order
+        
+        stat() releases the GIL, so on large (possibly cold-cache or network)
+        directories the per-entry syscalls are overlapped on a thread pool
+        instead of being issued one by one (one contiguous chunk per worker,
+        so the pool adds no per-entry overhead on a warm cache). Results are
+        produced lazily: a streaming caller gets the first chunk as soon as
+        it is done.
+        """
+        if len(entries) <= self.PARALLEL_STAT_THRESHOLD:
+            return map(_stat_entry, entries)
+        
+        chunk_size = -(-len(entries) // self._stat_workers)
+        chunks = [entries[i:i + chunk_size]
+                  for i in range(0, len(entries), chunk_size)]
+        return chain.from_iterable(self._get_stat_executor().map(_stat_entries, chunks))
     
     def _validate_path(self, path: str) -> None:
         """
-        Validate that path is within home directory (security boundary)
+        Validate that path is absolute and exists
         
-        System call: access() - check if path is accessible
-        Error handling: FileNotFoundError, PermissionError
+        System call: stat() (via os.path.exists)
+        Error handling: FileNotFoundError, ValueError
+        
+        Only used on the home directory at start-up; every other operation
+        lets its own syscall raise (EAFP).
         """
         if not os.path.exists(path):
             raise FileNotFoundError(f"Path does not exist: {path}")
         
         if not os.path.isabs(path):
             raise ValueError(f"Path must be absolute: {path}")
+    
+    def _stat_directory(self, path: str) -> os.stat_result:
+        """
+        stat() a directory about to be listed and check it can be entered
+        
+        System calls: os.stat() → stat(), os.access(X_OK) → access()
+        
+        No exists()/isdir() pre-checks: stat() raises FileNotFoundError on
+        its own and yields the file type. A missing read permission surfaces
+        from open() in the caller, but a missing search (x) permission does
+        not: getdents64 still succeeds and only every per-entry fstatat()
+        fails with EACCES, which would show as an empty folder. So that
+        one permission is checked explicitly (also on cache hits).
+        """
+        dir_stat = os.stat(path)
+        if not S_ISDIR(dir_stat.st_mode):
+            raise NotADirectoryError(f"Not a directory: {path}")
+        if not os.access(path, os.X_OK):
+            raise PermissionError(f"Permission denied: {path}")
+        return dir_stat
+    
+    def _scan_directory(self, path: str, keyed_files: list) -> Iterator[FileNode]:
+        """
+        Read and stat every entry of path, yielding each FileNode in
+        directory (getdents64) order
         
-        # Resolve any symlinks to prevent escaping home directory
+        Each node is also appended to keyed_files as a
+        ((folder-last flag, casefolded name), node) pair for _store_listing().
+        Shared by list_directory() and iter_directory().
+        """
         try:
-            real_path = os.path.realpath(path)
-        except (OSError, RuntimeError) as e:
-            raise RuntimeError(f"Cannot resolve path: {path}") from e
+            # System call: open(O_DIRECTORY) once; every entry is then read
+            # (getdents64) and stat'ed (fstatat) relative to this directory
+            # fd, so the kernel never re-walks the full path per entry
+            if _SCANDIR_DIR_FD:
+                dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+            else:
+                dir_fd = None
+            
+            try:
+                # Reading all names first is cheap (getdents64 only) and lets
+                # large directories stat on the thread pool; results still
+                # arrive in order, chunk by chunk
+                with os.scandir(path if dir_fd is None else dir_fd) as scan:
+                    entries = list(scan)
+                
+                results = self._stat_results(entries)
+                
+                # Hoisted out of the loop: constructor, join and append are
+                # plain locals instead of global/attribute lookups per entry
+                file_node = FileNode
+                join = os.path.join
+                append = keyed_files.append
+                
+                for entry, result in zip(entries, results):
+                    if result is None:
+                        # Skip files we can't stat (broken symlinks, permission denied)
+                        continue
+                    
+                    is_symlink, stat_result = result
+                    # One unpack of the leading stat fields (st_mode, st_ino,
+                    # st_dev, st_nlink, st_uid, st_gid, st_size) by position;
+                    # the float timestamps are only exposed as attributes
+                    mode, ino, _, nlink, uid, gid, size = stat_result[:7]
+                    name = entry.name
+                    is_dir = S_ISDIR(mode)  # File type from inode st_mode
+                    
+                    node = file_node(
+                        name, join(path, name), is_dir, is_symlink, size,
+                        S_IMODE(mode),  # rwx bits for user/group/other
+                        uid, gid, stat_result.st_mtime, stat_result.st_atime,
+                        ino, nlink,
+                    )
+                    # Sort key (folders first, then case-insensitive name) is
+                    # built here from locals, paired with the node
+                    append(((not is_dir, name.casefold()), node))
+                    yield node
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied: {path}") from e
+        except OSError as e:
+            raise OSError(f"Error listing directory: {path}") from e
     
     def list_directory(self, path: str) -> List[FileNode]:
         """
         List all files and directories in a path
         
-        System call: os.listdir() → getdents()/getdents64()
-                    os.stat() → stat() [called for each entry]
+        System call: os.stat() → stat() [once, on the directory itself]
+                    os.access(X_OK) → access() [once, search permission]
+                    os.open(O_DIRECTORY) → open() [once]
+                    os.scandir(fd) → getdents64()
+                    DirEntry.stat() → fstatat(fd, name) [called for each entry]
         
         Returns:
             List of FileNode objects with metadata
             
         Raises:
-            PermissionError: If no read+execute permission on directory
+            PermissionError: If the directory cannot be read or entered
             FileNotFoundError: If directory doesn't exist
             NotADirectoryError: If path is not a directory
         """
-        self._validate_path(path)
+        dir_stat = self._stat_directory(path)
         
-        if not os.path.isdir(path):
-            raise NotADirectoryError(f"Not a directory: {path}")
+        # A directory's mtime changes whenever an entry is added, removed or
+        # renamed, so an unchanged st_mtime_ns means the cached names still
+        # hold; within DIR_CACHE_TTL no per-entry stat() is needed either
+        mtime_ns = dir_stat.st_mtime_ns
+        cached = self._get_cached_listing(path, mtime_ns)
+        if cached is not None:
+            return list(cached)
+        
+        keyed_files = []
+        for _ in self._scan_directory(path, keyed_files):
+            pass
         
-        # Check read + execute permissions on directory
-        if not os.access(path, os.R_OK | os.X_OK):
-            raise PermissionError(f"No permission to read directory: {path}")
+        return list(self._store_listing(path, mtime_ns, keyed_files))
+    
+    def iter_directory(self, path: str) -> Iterator[FileNode]:
+        """
+        Yield the files and directories in a path as they are read
         
-        files = []
+        System calls: same as list_directory(), but each FileNode is yielded
+        as soon as its fstatat() result is in (chunked on the thread pool
+        above PARALLEL_STAT_THRESHOLD entries), so a caller can show the
+        first entries before the whole directory has been stat'ed.
         
-        try:
-            # System call: getdents/getdents64 to read directory entries
-            entries = os.listdir(path)
-        except PermissionError as e:
-            raise PermissionError(f"Permission denied: {path}") from e
-        except OSError as e:
-            raise OSError(f"Error listing directory: {path}") from e
+        Entries come in directory (getdents64) order, NOT sorted; use
+        list_directory() when sorted output is needed. A fully consumed
+        iteration stores the sorted listing in the directory cache, so a
+        following list_directory() of the same path is a cache hit.
+        An unchanged cached directory is yielded from the cache (sorted).
         
-        for entry in entries:
-            file_path = os.path.join(path, entry)
-            
-            try:
-                # System call: stat() to get file metadata (inode information)
-                stat_result = os.stat(file_path)
-                mode = stat_result.st_mode
-                
-                # Extract file type from mode (inode st_mode field)
-                is_dir = stat.S_ISDIR(mode)
-                is_symlink = stat.S_ISLNK(mode)
-                
-                # Extract permission bits (rwx for user/group/other)
-                permissions = stat.S_IMODE(mode)
-                
-                node = FileNode(
-                    name=entry,
-                    path=file_path,
-                    is_dir=is_dir,
-                    is_symlink=is_symlink,
-                    size=stat_result.st_size,
-                    permissions=permissions,
-                    owner_uid=stat_result.st_uid,
-                    owner_gid=stat_result.st_gid,
-                    modified_time=stat_result.st_mtime,
-                    accessed_time=stat_result.st_atime,
-                    inode_number=stat_result.st_ino,
-                    hard_links=stat_result.st_nlink,
-                )
-                files.append(node)
-                
-            except (FileNotFoundError, PermissionError, OSError):
-                # Skip files we can't stat (broken symlinks, permission denied)
-                continue
+        Raises (on first iteration):
+            PermissionError: If the directory cannot be read or entered
+            FileNotFoundError: If directory doesn't exist
+            NotADirectoryError: If path is not a directory
+        """
+        dir_stat = self._stat_directory(path)
+        
+        mtime_ns = dir_stat.st_mtime_ns
+        cached = self._get_cached_listing(path, mtime_ns)
+        if cached is not None:
+            yield from cached
+            return
         
-        return sorted(files, key=lambda f: (not f.is_dir, f.name.lower()))
+        keyed_files = []
+        yield from self._scan_directory(path, keyed_files)
+        
+        self._store_listing(path, mtime_ns, keyed_files)
     
     def get_file_info(self, path: str) -> FileNode:
         """
@@ -204,8 +477,6 @@ class FileSystemAbstraction:
             FileNotFoundError: If file doesn't exist
             PermissionError: If cannot access file
         """
-        self._validate_path(path)
-        
         try:
             stat_result = os.stat(path)
         except FileNotFoundError:
@@ -213,24 +484,12 @@ class FileSystemAbstraction:
         except PermissionError:
             raise PermissionError(f"Permission denied: {path}")
         
-        mode = stat_result.st_mode
-        is_dir = stat.S_ISDIR(mode)
-        is_symlink = stat.S_ISLNK(mode)
-        permissions = stat.S_IMODE(mode)
+        mode, ino, _, nlink, uid, gid, size = stat_result[:7]
         
         return FileNode(
-            name=os.path.basename(path),
-            path=path,
-            is_dir=is_dir,
-            is_symlink=is_symlink,
-            size=stat_result.st_size,
-            permissions=permissions,
-            owner_uid=stat_result.st_uid,
-            owner_gid=stat_result.st_gid,
-            modified_time=stat_result.st_mtime,
-            accessed_time=stat_result.st_atime,
-            inode_number=stat_result.st_ino,
-            hard_links=stat_result.st_nlink,
+            os.path.basename(path), path, S_ISDIR(mode), S_ISLNK(mode), size,
+            S_IMODE(mode), uid, gid, stat_result.st_mtime, stat_result.st_atime,
+            ino, nlink,
         )
     
     def can_read(self, path: str) -> bool:
@@ -266,40 +525,65 @@ class FileSystemAbstraction:
         except (FileNotFoundError, OSError):
             return False
     
+    def can_rwx(self, path: str) -> Tuple[bool, bool, bool]:
+        """
+        Check read, write and execute permission together
+        
+        System call: os.access(R_OK | W_OK | X_OK) → access() [once]
+                     os.access() per mode → access() [only if one is missing]
+        
+        access() with a combined mask succeeds only if every mode is granted,
+        which is the common case for the user's own files and directories.
+        
+        Returns:
+            (can_read, can_write, can_execute)
+        """
+        try:
+            if os.access(path, os.R_OK | os.W_OK | os.X_OK):
+                return True, True, True
+        except OSError:
+            return False, False, False
+        return self.can_read(path), self.can_write(path), self.can_execute(path)
+    
     def delete_file(self, path: str) -> None:
         """
         Delete a file or directory
         
-        System calls: os.remove() → unlink() for files
+        System calls: os.lstat() → lstat() [file type, without following links]
+                     os.remove() → unlink() for files
                      os.rmdir() → rmdir() for empty directories
         
         Requires: Write permission on parent directory
                   Execute permission on parent directory (to modify it)
         
+        No access() pre-checks: the kernel enforces these permissions on
+        unlink()/rmdir() itself and reports EACCES/EPERM.
+        
         Raises:
+            FileNotFoundError: If the file doesn't exist
             PermissionError: If no write permission on parent
             IsADirectoryError: If trying to delete non-empty directory with remove()
             OSError: Other OS-level errors
         """
-        self._validate_path(path)
-        
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"File not found: {path}")
-        
-        parent = os.path.dirname(path)
+        # One lstat() both proves existence and gives the entry's own type;
+        # a symlink to a directory is unlinked, never rmdir'ed
+        try:
+            file_stat = os.lstat(path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         
-        # Check write + execute permission on parent directory
-        # (need write to delete entry from parent, execute to access parent)
-        if not os.access(parent, os.W_OK | os.X_OK):
-            raise PermissionError(f"No permission to delete {path}")
+        with self._dir_cache_lock:
+            self._dir_cache.pop(os.path.dirname(path), None)
         
         try:
-            if os.path.isdir(path):
+            if S_ISDIR(file_stat.st_mode):
                 # Empty directory
                 os.rmdir(path)  # System call: rmdir()
             else:
                 # Regular file or symlink
                 os.remove(path)  # System call: unlink()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         except PermissionError as e:
             raise PermissionError(f"Permission denied: {path}") from e
         except IsADirectoryError as e:
@@ -311,38 +595,34 @@ class FileSystemAbstraction:
         """
         Rename or move a file
         
-        System call: os.rename() → rename() / renameat()
+        System calls: os.lstat() → lstat() [destination must not exist]
+                     os.rename() → rename() / renameat()
         
         Requires: Write permission on both parent directories
                   Execute permission on both parent directories
         
+        No access()/exists() pre-checks on the source: rename() itself
+        reports a missing source (ENOENT) or missing permission (EACCES).
+        
         Raises:
             PermissionError: If no write permission on parent directories
             FileNotFoundError: If source file doesn't exist
             FileExistsError: If destination already exists
             OSError: Other OS-level errors
         """
-        self._validate_path(old_path)
-        self._validate_path(os.path.dirname(new_path))
-        
-        if not os.path.exists(old_path):
-            raise FileNotFoundError(f"File not found: {old_path}")
-        
-        old_parent = os.path.dirname(old_path)
-        new_parent = os.path.dirname(new_path)
-        
-        # Check permissions on both parent directories
-        if not os.access(old_parent, os.W_OK | os.X_OK):
-            raise PermissionError(f"No permission to modify source directory")
-        
-        if not os.access(new_parent, os.W_OK | os.X_OK):
-            raise PermissionError(f"No permission to modify destination directory")
-        
-        if os.path.exists(new_path):
+        # rename() silently replaces an existing destination on POSIX, so
+        # this check is the one pre-check that has to stay
+        if os.path.lexists(new_path):
             raise FileExistsError(f"Destination already exists: {new_path}")
         
+        with self._dir_cache_lock:
+            self._dir_cache.pop(os.path.dirname(old_path), None)
+            self._dir_cache.pop(os.path.dirname(new_path), None)
+        
         try:
             os.rename(old_path, new_path)  # System call: rename() / renameat()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {old_path}") from e
         except PermissionError as e:
             raise PermissionError(f"Permission denied during rename") from e
         except OSError as e:
@@ -356,13 +636,22 @@ class FileSystemAbstraction:
     def normalize_path(self, path: str) -> str:
         """
         Normalize path (remove .., ., trailing slashes)
-        Resolves symlinks
+        Resolves symlinks (results are cached, see clear_path_cache)
         """
         try:
-            return os.path.realpath(os.path.expanduser(path))
+            return _resolve_path(path)
         except (OSError, RuntimeError):
             return path
     
+    def clear_path_cache(self) -> None:
+        """Drop cached path resolutions (e.g. after symlinks change)"""
+        _resolve_path.cache_clear()
+    
+    def clear_directory_cache(self) -> None:
+        """Drop cached directory listings (e.g. to pick up changed file sizes)"""
+        with self._dir_cache_lock:
+            self._dir_cache.clear()
+    
     def get_absolute_path(self, relative_path: str) -> str:
         """Convert relative path to absolute"""
         if os.path.isabs(relative_path):
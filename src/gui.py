@@ -9,15 +9,19 @@ coordinates user interactions with the file manager.
 
 import sys
 import os
-from typing import Optional, List
+import time
+from typing import Callable, Optional, List
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QListWidgetItem, QLabel, QPushButton, QLineEdit,
     QMessageBox, QMenu, QDialog, QInputDialog, QTreeWidget, QTreeWidgetItem,
-    QSplitter, QHeaderView, QAbstractItemView, QTableWidget, QTableWidgetItem,
+    QSplitter, QHeaderView, QAbstractItemView, QTableView,
     QStatusBar, QToolBar, QComboBox, QProgressBar
 )
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QObject, QTimer
+from PyQt5.QtCore import (
+    Qt, QSize, pyqtSignal, QObject, QTimer, QAbstractTableModel, QModelIndex,
+    QRunnable, QThreadPool
+)
 from PyQt5.QtGui import QIcon, QFont, QColor
 import stat
 
@@ -26,10 +30,148 @@ from filesystem import FileNode
 from chatbot import ChatbotWidget
 
 
+# File list row kinds: (name column icon, type column label)
+FOLDER_ROW = ("📁", "Folder")
+LINK_ROW = ("🔗", "Link")
+FILE_ROW = ("📄", "File")
+
+
+class FileTableModel(QAbstractTableModel):
+    """
+    Table model over a List[FileNode]
+    
+    Unlike QTableWidget, no item objects are created per cell: the view
+    asks data() only for the cells it is about to paint.
+    """
+    
+    HEADERS = ("Name", "Type", "Size", "Modified", "Permissions")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.files: List[FileNode] = []
+    
+    def set_files(self, files: List[FileNode]):
+        """Replace the listing (one model reset instead of per-row inserts)"""
+        self.beginResetModel()
+        self.files = files
+        self.endResetModel()
+    
+    def append_files(self, files: List[FileNode]):
+        """Add rows at the end (used while a directory is still streaming in)"""
+        if not files:
+            return
+        first = len(self.files)
+        self.beginInsertRows(QModelIndex(), first, first + len(files) - 1)
+        self.files.extend(files)
+        self.endInsertRows()
+    
+    def file_at(self, row: int) -> FileNode:
+        """Return the FileNode shown in a row"""
+        return self.files[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.files)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        file_node = self.files[index.row()]
+        
+        if role == Qt.DisplayRole:
+            # Only called for cells inside the viewport, so each string is
+            # built on demand instead of for every row up front
+            column = index.column()
+            
+            if column == 2:
+                return "-" if file_node.is_dir else file_node.get_human_size()
+            if column == 3:
+                return file_node.get_modified_time_str()
+            if column == 4:
+                return file_node.get_permission_octal()
+            
+            if file_node.is_dir:
+                icon, file_type = FOLDER_ROW
+            elif file_node.is_symlink:
+                icon, file_type = LINK_ROW
+            else:
+                icon, file_type = FILE_ROW
+            
+            if column == 0:
+                return f"{icon} {file_node.name}"
+            return file_type
+        
+        if role == Qt.UserRole:
+            return file_node.path  # Full path
+        if role == Qt.UserRole + 1:
+            return file_node  # FileNode object
+        
+        return None
+
+
 class SignalEmitter(QObject):
     """Signal emitter for file operations"""
     operation_completed = pyqtSignal(OperationResult)
     current_directory_changed = pyqtSignal(str)
+    directory_loaded = pyqtSignal(int, object)  # (load epoch, OperationResult)
+    directory_batch = pyqtSignal(int, object)  # (load epoch, List[FileNode])
+
+
+class DirectoryLoadTask(QRunnable):
+    """Browses a directory on a worker thread and reports the result"""
+    
+    # Streamed rows are flushed to the GUI at most once per frame, or
+    # sooner when this many have piled up
+    BATCH_INTERVAL = 0.016  # seconds
+    BATCH_SIZE = 500
+    
+    def __init__(self, file_manager: FileManager, path: str, epoch: int,
+                 current_epoch: Callable[[], int], signals: SignalEmitter):
+        super().__init__()
+        self.file_manager = file_manager
+        self.path = path
+        self.epoch = epoch
+        self.current_epoch = current_epoch  # Newest epoch the window asked for
+        self.signals = signals
+    
+    def is_stale(self) -> bool:
+        """True once a newer navigation has superseded this load"""
+        return self.current_epoch() != self.epoch
+    
+    def run(self):
+        """List the directory (scandir + stat) off the GUI thread"""
+        if self.is_stale():
+            return
+        
+        # Stream unsorted rows so a large directory shows its first screenful
+        # early; a directory read within one interval emits no batch at all
+        batch = []
+        deadline = time.monotonic() + self.BATCH_INTERVAL
+        try:
+            for file_node in self.file_manager.iter_directory(self.path):
+                if self.is_stale():
+                    return
+                batch.append(file_node)
+                if len(batch) >= self.BATCH_SIZE or time.monotonic() >= deadline:
+                    self.signals.directory_batch.emit(self.epoch, batch)
+                    batch = []
+                    deadline = time.monotonic() + self.BATCH_INTERVAL
+        except OSError:
+            pass  # Reported by browse_directory() below
+        if self.is_stale():
+            return
+        
+        # Sorted listing; the completed stream left it in the directory cache
+        result = self.file_manager.browse_directory(self.path)
+        self.signals.directory_loaded.emit(self.epoch, result)
 
 
 class FileExplorerWindow(QMainWindow):
@@ -56,15 +198,29 @@ class FileExplorerWindow(QMainWindow):
         # Signals
         self.signals = SignalEmitter()
         self.signals.operation_completed.connect(self.on_operation_completed)
+        self.signals.directory_loaded.connect(self.on_directory_loaded)
+        self.signals.directory_batch.connect(self.on_directory_batch)
+        
+        # Directory loads run on one dedicated worker thread so they finish
+        # in request order; the epoch lets stale results be dropped
+        self.load_pool = QThreadPool(self)
+        self.load_pool.setMaxThreadCount(1)
+        self.load_epoch = 0
+        self.streamed_epoch = 0  # Epoch whose rows the file list currently shows
+        # Finished listing that streamed rows replaced (None when none did)
+        self.files_before_stream: Optional[List[FileNode]] = None
         
         # Register file manager callback
         self.file_manager.register_operation_callback(
             self.signals.operation_completed.emit
         )
         
-        # Navigation history
+        # Navigation history. requested_directory is the directory last asked
+        # for: FileManager.current_directory only changes once a load has
+        # finished on the worker thread, so it lags behind quick clicks
         self.history_back = []
         self.history_forward = []
+        self.requested_directory: Optional[str] = None
         
         # Setup UI
         self.setup_ui()
@@ -110,6 +266,9 @@ class FileExplorerWindow(QMainWindow):
         self.quick_access_tree.setDefaultDropAction(Qt.MoveAction)
         left_layout.addWidget(self.quick_access_tree, 10)
         
+        # Standard locations don't change while browsing: build the tree once
+        self.populate_quick_access()
+        
         # Add chatbot with stretch
         self.chatbot = ChatbotWidget()
         left_layout.addWidget(self.chatbot, 3)
@@ -121,15 +280,12 @@ class FileExplorerWindow(QMainWindow):
         # Center panel: File list
         center_layout = QVBoxLayout()
         center_layout.addWidget(QLabel("Files and Folders"))
-        self.file_list = QTableWidget()
-        self.file_list.setColumnCount(5)
-        self.file_list.setHorizontalHeaderLabels([
-            "Name", "Type", "Size", "Modified", "Permissions"
-        ])
+        self.file_model = FileTableModel(self)
+        self.file_list = QTableView()
+        self.file_list.setModel(self.file_model)
         self.file_list.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.file_list.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.file_list.itemDoubleClicked.connect(self.on_file_opened)
-        self.file_list.itemRightClicked = lambda item: self.show_context_menu(item)
+        self.file_list.doubleClicked.connect(self.on_file_opened)
         self.file_list.customContextMenuRequested.connect(self.on_context_menu_requested)
         self.file_list.setContextMenuPolicy(Qt.CustomContextMenu)
         center_layout.addWidget(self.file_list)
@@ -177,61 +333,66 @@ class FileExplorerWindow(QMainWindow):
         self.refresh_button.clicked.connect(self.on_refresh_clicked)
         toolbar.addWidget(self.refresh_button)
     
-    def navigate_to(self, path: str):
+    def navigate_to(self, path: str, add_to_history: bool = True):
         """Navigate to a directory"""
-        # Save to history
-        current = self.file_manager.get_current_directory()
-        if current and current != path:
+        # Save to history (Back/Forward move through it themselves)
+        current = self.requested_directory
+        if add_to_history and current and current != path:
             self.history_back.append(current)
             self.history_forward.clear()
+        self.requested_directory = path
+        
+        # Browse directory in the background; only the newest request counts
+        self.load_epoch += 1
+        self.statusBar().showMessage(f"Loading {path}...")
+        # Queued loads that never started are superseded; a running one
+        # notices the new epoch and stops early
+        self.load_pool.clear()
+        self.load_pool.start(
+            DirectoryLoadTask(self.file_manager, path, self.load_epoch,
+                              lambda: self.load_epoch, self.signals)
+        )
+    
+    def on_directory_batch(self, epoch: int, files: List[FileNode]):
+        """Show rows of a directory that is still loading (unsorted)"""
+        if epoch != self.load_epoch:
+            return
         
-        # Browse directory
-        result = self.file_manager.browse_directory(path)
+        if self.streamed_epoch != epoch:
+            # First batch of this load replaces the previous directory; the
+            # last finished listing is kept aside in case the load fails
+            self.streamed_epoch = epoch
+            if self.files_before_stream is None:
+                self.files_before_stream = self.file_model.files
+            self.file_model.set_files([])
+        self.file_model.append_files(files)
+    
+    def on_directory_loaded(self, epoch: int, result: OperationResult):
+        """Show a finished directory load (ignores superseded navigations)"""
+        if epoch != self.load_epoch:
+            return
         
         if result.success:
-            self.location_input.setText(path)
+            # Normalized path of the directory now shown
+            self.requested_directory = self.file_manager.get_current_directory()
+            self.location_input.setText(self.requested_directory)
             self.populate_file_list(result.data)
-            self.populate_quick_access()
             self.statusBar().showMessage(result.message)
         else:
+            # Back to the directory still on screen, which the location bar
+            # names (FileManager.current_directory may be a cancelled load's)
+            self.requested_directory = self.location_input.text() or None
+            if self.files_before_stream is not None:
+                # Drop partially streamed rows and show again the directory
+                # the location bar still names
+                self.populate_file_list(self.files_before_stream)
+            self.statusBar().showMessage("Ready")
             QMessageBox.warning(self, "Error", result.message)
+        self.files_before_stream = None
     
     def populate_file_list(self, files: List[FileNode]):
         """Populate file list with FileNode objects"""
-        self.file_list.setRowCount(len(files))
-        
-        for row, file_node in enumerate(files):
-            # Name
-            name_item = QTableWidgetItem(file_node.name)
-            name_item.setData(Qt.UserRole, file_node.path)  # Store full path
-            name_item.setData(Qt.UserRole + 1, file_node)  # Store FileNode object
-            if file_node.is_dir:
-                name_item.setText(f"📁 {file_node.name}")
-            elif file_node.is_symlink:
-                name_item.setText(f"🔗 {file_node.name}")
-            else:
-                name_item.setText(f"📄 {file_node.name}")
-            self.file_list.setItem(row, 0, name_item)
-            
-            # Type
-            if file_node.is_dir:
-                file_type = "Folder"
-            elif file_node.is_symlink:
-                file_type = "Link"
-            else:
-                file_type = "File"
-            self.file_list.setItem(row, 1, QTableWidgetItem(file_type))
-            
-            # Size
-            size_str = f"{file_node.size} B" if not file_node.is_dir else "-"
-            self.file_list.setItem(row, 2, QTableWidgetItem(size_str))
-            
-            # Modified time
-            self.file_list.setItem(row, 3, QTableWidgetItem(file_node.get_modified_time_str()))
-            
-            # Permissions
-            perm_octal = file_node.get_permission_octal()
-            self.file_list.setItem(row, 4, QTableWidgetItem(perm_octal))
+        self.file_model.set_files(files)
     
     def populate_quick_access(self):
         """Populate quick access tree"""
@@ -251,9 +412,9 @@ class FileExplorerWindow(QMainWindow):
                 item.setData(0, Qt.UserRole, path)
                 self.quick_access_tree.addTopLevelItem(item)
     
-    def on_file_opened(self, item):
+    def on_file_opened(self, index: QModelIndex):
         """Handle file/folder opened (double-click)"""
-        file_node = item.data(Qt.UserRole + 1)
+        file_node = self.file_model.file_at(index.row())
         
         if file_node.is_dir:
             # Navigate to directory
@@ -268,11 +429,11 @@ class FileExplorerWindow(QMainWindow):
     
     def on_context_menu_requested(self, pos):
         """Show context menu for file operations"""
-        item = self.file_list.itemAt(pos)
-        if not item:
+        index = self.file_list.indexAt(pos)
+        if not index.isValid():
             return
         
-        file_node = item.data(Qt.UserRole + 1)
+        file_node = self.file_model.file_at(index.row())
         
         menu = QMenu(self)
         
@@ -299,7 +460,7 @@ class FileExplorerWindow(QMainWindow):
         delete_action = menu.addAction("🗑️  Delete")
         delete_action.triggered.connect(lambda: self.on_delete_clicked(file_node))
         
-        menu.exec_(self.file_list.mapToGlobal(pos))
+        menu.exec_(self.file_list.viewport().mapToGlobal(pos))
     
     def on_delete_clicked(self, file_node: FileNode):
         """Handle delete operation"""
@@ -313,7 +474,7 @@ class FileExplorerWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             result = self.file_manager.delete_file(file_node.path)
             if result.success:
-                self.navigate_to(self.file_manager.get_current_directory())
+                self.navigate_to(self.requested_directory)
             else:
                 QMessageBox.warning(self, "Delete Failed", result.message)
     
@@ -329,7 +490,7 @@ class FileExplorerWindow(QMainWindow):
         if ok and new_name:
             result = self.file_manager.rename_file(file_node.path, new_name)
             if result.success:
-                self.navigate_to(self.file_manager.get_current_directory())
+                self.navigate_to(self.requested_directory)
             else:
                 QMessageBox.warning(self, "Rename Failed", result.message)
     
@@ -355,8 +516,8 @@ Hard Links: {file_node.hard_links}
 Permissions (Octal): {perm_octal}
 Permissions (String): {perm_str}
 
-Owner UID: {file_node.owner_uid}
-Owner GID: {file_node.owner_gid}
+Owner: {file_node.owner_name} (UID {file_node.owner_uid})
+Group: {file_node.group_name} (GID {file_node.owner_gid})
 
 Modified: {file_node.get_modified_time_str()}
 Accessed: {file_node.accessed_time}
@@ -367,24 +528,23 @@ Accessed: {file_node.accessed_time}
     def on_back_clicked(self):
         """Navigate back in history"""
         if self.history_back:
-            current = self.file_manager.get_current_directory()
-            self.history_forward.append(current)
-            path = self.history_back.pop()
-            self.navigate_to(path)
+            self.history_forward.append(self.requested_directory)
+            self.navigate_to(self.history_back.pop(), add_to_history=False)
     
     def on_forward_clicked(self):
         """Navigate forward in history"""
         if self.history_forward:
-            current = self.file_manager.get_current_directory()
-            self.history_back.append(current)
-            path = self.history_forward.pop()
-            self.navigate_to(path)
+            self.history_back.append(self.requested_directory)
+            self.navigate_to(self.history_forward.pop(), add_to_history=False)
     
     def on_up_clicked(self):
         """Navigate to parent directory"""
-        result = self.file_manager.navigate_parent()
-        if result.success:
-            self.populate_file_list(result.data)
+        # Loaded on the worker thread like any other navigation
+        parent = self.file_manager.get_parent_directory(self.requested_directory)
+        if parent is None:
+            self.statusBar().showMessage("Already at root directory")
+        else:
+            self.navigate_to(parent)
     
     def on_home_clicked(self):
         """Navigate to home directory"""
@@ -392,7 +552,8 @@ Accessed: {file_node.accessed_time}
     
     def on_refresh_clicked(self):
         """Refresh current directory"""
-        self.navigate_to(self.file_manager.get_current_directory())
+        self.file_manager.clear_caches()
+        self.navigate_to(self.requested_directory)
     
     def on_go_clicked(self):
         """Navigate to path entered in location bar"""
@@ -4,7 +4,10 @@ AIFE Test Suite
 Demonstrates file system operations and error handling
 
 Usage:
-    python3 test_aife.py
+    python3 test_aife.py [-v]
+
+    -v (or AIFE_VERBOSE=1) prints the inode details even when the output
+    is not a terminal (e.g. captured in CI)
 
 Tests:
     1. Basic directory listing
@@ -16,49 +19,141 @@ Tests:
 
 import sys
 import os
+import io
+import atexit
 import tempfile
-import shutil
+import threading
+from collections import namedtuple
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add src to path (absolute, and only once even if this module is re-imported)
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from filesystem import FileSystemAbstraction, FileNode
 from file_manager import FileManager, OperationResult
 
 
+# Files created by test_setup: (filename, content). Bytes payloads are
+# written through raw fds (no text-mode encoder/buffer); tests that check
+# every file iterate over this table
+TEST_FILES = [
+    ("test1.txt", b"content1"),
+    ("test2.txt", b"content2"),
+    ("document.md", b"# Test Document"),
+]
+
+
+def write_file(path, *buffers):
+    """
+    Create/truncate a file and write bytes buffers: open() + writev() + close()
+    
+    Several buffers go out in one vectored write; bytes already expose the
+    buffer protocol, so no memoryview wrapping is needed.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.writev(fd, buffers)
+    finally:
+        os.close(fd)
+
+
+# Detailed metadata is printed for interactive runs or on request; checked
+# here, before main() swaps sys.stdout for the report buffer
+_VERBOSE = (bool(os.environ.get("AIFE_VERBOSE")) or "-v" in sys.argv
+            or sys.stdout.isatty())
+
+
+# Precomputed paths of the test tree (joined once, in test_setup)
+TestPaths = namedtuple("TestPaths", "root file1 file2 doc subdir subfile scratch")
+
+
 def test_setup():
-    """Setup test environment"""
-    test_dir = os.path.expanduser("~/AIFE_TEST")
-    if not os.path.exists(test_dir):
-        os.makedirs(test_dir)
+    """Setup test environment (on tmpfs when available)"""
+    # /dev/shm is memory-backed: the create/stat/unlink-heavy setup and
+    # teardown never touch a journaled disk filesystem
+    test_dir = tempfile.mkdtemp(
+        prefix="aife_",
+        dir="/dev/shm" if os.path.isdir("/dev/shm") else None
+    )
     
-    # Create test files
-    test_files = [
-        ("test1.txt", "content1"),
-        ("test2.txt", "content2"),
-        ("document.md", "# Test Document"),
-    ]
+    # Paths are built with f-strings: the separator is always "/" here
+    paths = TestPaths(
+        root=test_dir,
+        file1=f"{test_dir}/test1.txt",
+        file2=f"{test_dir}/test2.txt",
+        doc=f"{test_dir}/document.md",
+        subdir=f"{test_dir}/subfolder",
+        subfile=f"{test_dir}/subfolder/subfile.txt",
+        scratch=f"{test_dir}/scratch",
+    )
     
-    for filename, content in test_files:
-        path = os.path.join(test_dir, filename)
-        with open(path, 'w') as f:
-            f.write(content)
+    # Create test files
+    for filename, content in TEST_FILES:
+        write_file(f"{test_dir}/{filename}", content)
     
     # Create test subdirectory
-    subdir = os.path.join(test_dir, "subfolder")
-    if not os.path.exists(subdir):
-        os.makedirs(subdir)
-        with open(os.path.join(subdir, "subfile.txt"), 'w') as f:
-            f.write("sub content")
+    os.makedirs(paths.subdir, exist_ok=True)  # mkdir() only; EEXIST handled in C
+    write_file(paths.subfile, b"sub content")
+    
+    # Rename/delete tests work in their own directory, so listings of the
+    # root stay the same while test groups run concurrently
+    os.makedirs(paths.scratch, exist_ok=True)
+    
+    return paths
+
+
+# One test tree shared by every test_* function (created on first use)
+_TEST_PATHS = None
+
+
+def get_test_paths():
+    """Return the shared test tree's TestPaths, creating it on first call"""
+    global _TEST_PATHS
+    if _TEST_PATHS is None:
+        _TEST_PATHS = test_setup()
+        atexit.register(test_cleanup, _TEST_PATHS.root)
+    return _TEST_PATHS
+
+
+def create_test_file(test_dir, filename, content=b"scratch"):
+    """
+    Create a file for a test that renames or deletes it
+    
+    The shared tree is never mutated, so no per-test copy of it is needed;
+    a fresh few-byte file is one open/write/close, cheaper than cloning
+    (copy_file_range/FICLONE) a template file.
+    """
+    path = f"{test_dir}/{filename}"
+    write_file(path, content)
+    return path
+
+
+def fast_rmtree(path):
+    """
+    Remove a directory tree: scandir + unlink/rmdir only
     
-    return test_dir
+    is_dir(follow_symlinks=False) is answered from the getdents64 d_type,
+    so no per-entry stat() (shutil.rmtree adds lstat/fstat safety checks).
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
 
 
 def test_cleanup(test_dir):
     """Clean up test environment"""
-    if os.path.exists(test_dir):
-        shutil.rmtree(test_dir)
-        print(f"✓ Cleaned up test directory: {test_dir}")
+    try:
+        fast_rmtree(test_dir)
+    except FileNotFoundError:
+        pass  # Already gone
+    print(f"✓ Cleaned up test directory: {test_dir}")
 
 
 def print_section(title):
@@ -68,20 +163,28 @@ def print_section(title):
     print(f"{'='*60}")
 
 
+_PASS_PREFIX = "✓ PASS: "
+_FAIL_PREFIX = "✗ FAIL: "
+
+# Names of failed results, reported by main() and reflected in its exit status
+_FAILED = []
+
+
 def print_result(test_name, passed, message=""):
-    """Print test result"""
-    status = "✓ PASS" if passed else "✗ FAIL"
-    print(f"{status}: {test_name}")
-    if message:
-        print(f"  → {message}")
+    """Print test result (one write per result) and record failures"""
+    if not passed:
+        _FAILED.append(test_name)
+    sys.stdout.write(
+        (_PASS_PREFIX if passed else _FAIL_PREFIX) + test_name
+        + ("\n  → " + message + "\n" if message else "\n")
+    )
 
 
-def test_filesystem_abstraction():
+def test_filesystem_abstraction(paths, fs, fm):
     """Test FileSystemAbstraction layer"""
     print_section("1. File System Abstraction Layer Tests")
     
-    test_dir = test_setup()
-    fs = FileSystemAbstraction(test_dir)
+    test_dir = paths.root
     
     # Test 1.1: List directory
     try:
@@ -95,18 +198,25 @@ def test_filesystem_abstraction():
     
     # Test 1.2: Get file info
     try:
-        test_file = os.path.join(test_dir, "test1.txt")
+        test_file = paths.file1
         info = fs.get_file_info(test_file)
         passed = info.name == "test1.txt"
         print_result("Get file info", passed, f"File: {info.name}, Size: {info.size}")
     except Exception as e:
         print_result("Get file info", False, str(e))
     
-    # Test 1.3: Permission checks
+    # Test 1.3: File info for every fixture file
+    for filename, content in TEST_FILES:
+        try:
+            info = fs.get_file_info(f"{test_dir}/{filename}")
+            passed = info.name == filename and info.size == len(content)
+            print_result(f"File info: {filename}", passed, f"Size: {info.size}")
+        except Exception as e:
+            print_result(f"File info: {filename}", False, str(e))
+    
+    # Test 1.4: Permission checks
     try:
-        can_read = fs.can_read(test_dir)
-        can_write = fs.can_write(test_dir)
-        can_exec = fs.can_execute(test_dir)
+        can_read, can_write, can_exec = fs.can_rwx(test_dir)
         passed = can_read and can_write and can_exec
         print_result(
             "Permission checks",
@@ -116,7 +226,7 @@ def test_filesystem_abstraction():
     except Exception as e:
         print_result("Permission checks", False, str(e))
     
-    # Test 1.4: Path validation
+    # Test 1.5: Path validation
     try:
         invalid_path = "/nonexistent/path/to/file"
         try:
@@ -126,16 +236,13 @@ def test_filesystem_abstraction():
             print_result("Path validation", True, "Correctly rejected invalid path")
     except Exception as e:
         print_result("Path validation", False, str(e))
-    
-    test_cleanup(test_dir)
 
 
-def test_file_operations():
+def test_file_operations(paths, fs, fm):
     """Test file operations"""
     print_section("2. File Operations Tests")
     
-    test_dir = test_setup()
-    fm = FileManager(test_dir)
+    test_dir = paths.root
     
     # Test 2.1: Browse directory
     try:
@@ -147,23 +254,23 @@ def test_file_operations():
     
     # Test 2.2: Get file info
     try:
-        test_file = os.path.join(test_dir, "test1.txt")
+        test_file = paths.file1
         result = fm.get_file_info(test_file)
         passed = result.success and result.data.name == "test1.txt"
         print_result("Get file info", passed, result.message)
     except Exception as e:
         print_result("Get file info", False, str(e))
     
-    # Test 2.3: Rename file
+    # Test 2.3: Rename file (own scratch file; the shared tree stays intact)
     try:
-        test_file = os.path.join(test_dir, "test1.txt")
-        result = fm.rename_file(test_file, "renamed.txt")
+        test_file = create_test_file(paths.scratch, "test_rename_src.txt")
+        result = fm.rename_file(test_file, "test_rename_dst.txt")
         passed = result.success
         print_result("Rename file", passed, result.message)
         
         # Verify rename
         if passed:
-            renamed_path = os.path.join(test_dir, "renamed.txt")
+            renamed_path = f"{paths.scratch}/test_rename_dst.txt"
             exists = os.path.exists(renamed_path)
             print_result("  Verify rename", exists, f"File exists: {exists}")
     except Exception as e:
@@ -171,26 +278,23 @@ def test_file_operations():
     
     # Test 2.4: Delete file
     try:
-        test_file = os.path.join(test_dir, "test2.txt")
+        test_file = create_test_file(paths.scratch, "test_delete_src.txt")
         result = fm.delete_file(test_file)
         passed = result.success and not os.path.exists(test_file)
         print_result("Delete file", passed, result.message)
     except Exception as e:
         print_result("Delete file", False, str(e))
-    
-    test_cleanup(test_dir)
 
 
-def test_error_handling():
+def test_error_handling(paths, fs, fm):
     """Test error handling"""
     print_section("3. Error Handling Tests")
     
-    test_dir = test_setup()
-    fm = FileManager(test_dir)
+    test_dir = paths.root
     
     # Test 3.1: File not found
     try:
-        nonexistent = os.path.join(test_dir, "does_not_exist.txt")
+        nonexistent = f"{test_dir}/does_not_exist.txt"
         result = fm.get_file_info(nonexistent)
         passed = not result.success and "NotFound" in result.error_type
         print_result("File not found error", passed, result.message)
@@ -199,7 +303,7 @@ def test_error_handling():
     
     # Test 3.2: Not a directory
     try:
-        test_file = os.path.join(test_dir, "test1.txt")
+        test_file = paths.file1
         result = fm.browse_directory(test_file)
         passed = not result.success and "NotADirectory" in result.error_type
         print_result("Not a directory error", passed, result.message)
@@ -208,22 +312,27 @@ def test_error_handling():
     
     # Test 3.3: Invalid filename in rename
     try:
-        test_file = os.path.join(test_dir, "test1.txt")
+        test_file = paths.file1
         result = fm.rename_file(test_file, "bad/name.txt")
         passed = not result.success
         print_result("Invalid filename error", passed, result.message)
     except Exception as e:
         print_result("Invalid filename error", False, str(e))
     
-    test_cleanup(test_dir)
+    # Test 3.4: NUL byte in new name (os.rename would raise ValueError)
+    try:
+        result = fm.rename_file(paths.file1, "a\x00b")
+        passed = not result.success and result.error_type == "InvalidFilename"
+        print_result("NUL in filename error", passed, repr(result.message))
+    except Exception as e:
+        print_result("NUL in filename error", False, str(e))
 
 
-def test_permission_scenarios():
+def test_permission_scenarios(paths, fs, fm):
     """Test permission-related scenarios"""
     print_section("4. Permission Scenarios")
     
-    test_dir = test_setup()
-    fm = FileManager(test_dir)
+    test_dir = paths.root
     
     # Test 4.1: Can read own directory
     try:
@@ -234,83 +343,161 @@ def test_permission_scenarios():
         print_result("Read own directory", False, str(e))
     
     # Test 4.2: Cannot read /root (if not root)
+    # Decided before any syscall on /root (may be slow on NFS/hardened CI);
+    # set AIFE_SKIP_ROOT=1 to skip it explicitly
+    if os.getuid() == 0:
+        print_result("Permission denied on /root", True, "Running as root, skipped")
+        return
+    if os.environ.get("AIFE_SKIP_ROOT") or not os.path.isdir("/root"):
+        print_result("Permission denied on /root", True, "skipped")
+        return
+    
     try:
         result = fm.browse_directory("/root")
-        if os.getuid() != 0:
-            passed = not result.success and "PermissionDenied" in result.error_type
-            print_result(
-                "Permission denied on /root",
-                passed,
-                f"Correctly rejected: {result.message}"
-            )
-        else:
-            print_result("Permission denied on /root", True, "Running as root, skipped")
+        passed = not result.success and "PermissionDenied" in result.error_type
+        print_result(
+            "Permission denied on /root",
+            passed,
+            f"Correctly rejected: {result.message}"
+        )
     except Exception as e:
         print_result("Permission denied on /root", False, str(e))
-    
-    test_cleanup(test_dir)
 
 
-def test_inode_information():
+def test_inode_information(paths, fs, fm):
     """Test inode information extraction"""
     print_section("5. Inode Information Tests")
     
-    test_dir = test_setup()
-    fm = FileManager(test_dir)
+    test_dir = paths.root
     
     try:
-        test_file = os.path.join(test_dir, "test1.txt")
+        test_file = paths.file1
         result = fm.get_file_info(test_file)
         
         if result.success:
             node = result.data
             print_result("Extract inode info", True, "")
-            print(f"  Inode number: {node.inode_number}")
-            print(f"  Size: {node.size} bytes")
-            print(f"  Permissions (octal): {node.get_permission_octal()}")
-            print(f"  Permissions (string): {node.get_permissions_string()}")
-            print(f"  Owner UID: {node.owner_uid}")
-            print(f"  Owner GID: {node.owner_gid}")
-            print(f"  Modified: {node.get_modified_time_str()}")
-            print(f"  Hard links: {node.hard_links}")
-            print(f"  Type: {'Directory' if node.is_dir else 'File'}")
+            if _VERBOSE:
+                print(f"  Inode number: {node.inode_number}")
+                print(f"  Size: {node.size} bytes")
+                print(f"  Permissions (octal): {node.get_permission_octal()}")
+                print(f"  Permissions (string): {node.get_permissions_string()}")
+                print(f"  Owner UID: {node.owner_uid}")
+                print(f"  Owner GID: {node.owner_gid}")
+                print(f"  Modified: {node.get_modified_time_str()}")
+                print(f"  Hard links: {node.hard_links}")
+                print(f"  Type: {'Directory' if node.is_dir else 'File'}")
         else:
             print_result("Extract inode info", False, result.message)
     except Exception as e:
         print_result("Extract inode info", False, str(e))
     
-    test_cleanup(test_dir)
+    # Human-readable size must not modify the node (used to divide size in place)
+    try:
+        node = replace(fm.get_file_info(paths.file1).data, size=1536)
+        first, second = node.get_human_size(), node.get_human_size()
+        passed = first == second == "1.5 KB" and node.size == 1536
+        print_result("Human-readable size", passed, f"{first}, {second}, size={node.size}")
+    except Exception as e:
+        print_result("Human-readable size", False, str(e))
+
+
+# Test groups run by main(): (short name, function(paths, fs, fm)). They
+# run concurrently; output is still printed in this order
+TESTS = [
+    ("fs_abs", test_filesystem_abstraction),
+    ("file_ops", test_file_operations),
+    ("errors", test_error_handling),
+    ("permissions", test_permission_scenarios),
+    ("inode", test_inode_information),
+]
+
+
+class ThreadOutput:
+    """stdout stand-in: each worker thread writes to its own buffer, others to stream"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text):
+        return getattr(self.local, "buffer", self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+
+def run_buffered(fn, out, *args):
+    """Run one test group with its output captured: returns (output, error)"""
+    out.local.buffer = io.StringIO()
+    error = None
+    try:
+        fn(*args)
+    except Exception as e:
+        error = e
+    return out.local.buffer.getvalue(), error
 
 
 def main():
-    """Run all tests"""
+    """Run all tests (the whole report is written to stdout in one go)"""
+    real_stdout = sys.stdout
+    report = io.StringIO()
+    out = ThreadOutput(report)
+    sys.stdout = out
+    try:
+        return run_suite(out)
+    finally:
+        sys.stdout = real_stdout
+        real_stdout.write(report.getvalue())
+        real_stdout.flush()
+
+
+def run_suite(out):
+    """Run every test group and print the report to the ThreadOutput"""
     print("\n" + "="*60)
     print(" AIFE Test Suite - OS Concepts Demonstration")
     print("="*60)
     
-    try:
-        test_filesystem_abstraction()
-        test_file_operations()
-        test_error_handling()
-        test_permission_scenarios()
-        test_inode_information()
-        
-        print_section("Test Suite Complete")
-        print("\n✓ All tests completed. Check results above.")
-        print("\nOs Concepts Demonstrated:")
-        print("  ✓ VFS Abstraction (FileSystemAbstraction layer)")
-        print("  ✓ System Calls (os.stat, os.listdir, os.remove, etc.)")
-        print("  ✓ File Permissions (rwx checks, EACCES errors)")
-        print("  ✓ Inode Metadata (st_ino, st_mode, st_size, etc.)")
-        print("  ✓ Error Handling (errno mapping to exceptions)")
-        print("  ✓ Path Resolution (realpath normalization)")
-        
-    except Exception as e:
-        print(f"\n✗ Test suite failed: {e}")
-        import traceback
-        traceback.print_exc()
+    # Build the shared tree and the objects under test once, before the
+    # workers start; every group gets the same (paths, fs, fm)
+    paths = get_test_paths()
+    fm = FileManager(paths.root)
+    fs = fm.fs
+    
+    # The groups are I/O-bound (syscalls release the GIL), so they run on a
+    # thread pool; each group's output is buffered and printed in TESTS order
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as pool:
+        futures = [pool.submit(run_buffered, fn, out, paths, fs, fm)
+                   for _, fn in TESTS]
+        results = [future.result() for future in futures]
+    
+    # A group that raises is recorded and the remaining groups still run
+    failures = []
+    for (name, _), (output, error) in zip(TESTS, results):
+        sys.stdout.write(output)
+        if error is not None:
+            failures.append((name, error))
+    
+    print_section("Test Suite Complete")
+    if failures or _FAILED:
+        if failures:
+            print(f"\n✗ {len(failures)} of {len(TESTS)} test groups failed:")
+            for name, e in failures:
+                print(f"  ✗ {name}: {type(e).__name__}: {e}")
+        if _FAILED:
+            print(f"\n✗ {len(_FAILED)} checks failed:")
+            for test_name in _FAILED:
+                print(f"  ✗ {test_name}")
         return 1
     
+    print("\n✓ All tests completed. Check results above.")
+    print("\nOs Concepts Demonstrated:")
+    print("  ✓ VFS Abstraction (FileSystemAbstraction layer)")
+    print("  ✓ System Calls (os.stat, os.scandir, os.remove, etc.)")
+    print("  ✓ File Permissions (rwx checks, EACCES errors)")
+    print("  ✓ Inode Metadata (st_ino, st_mode, st_size, etc.)")
+    print("  ✓ Error Handling (errno mapping to exceptions)")
+    print("  ✓ Path Resolution (realpath normalization)")
     return 0
 
 